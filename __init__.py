@@ -14,12 +14,18 @@ def _handle_calling(
         uri, 
         sample_collection, 
         api_key,
+        workers=8,
+        upload_workers=8,
+        skip_existing=True,
         delegate=False
         ):
     ctx = dict(dataset=sample_collection)
 
     params = dict(
         api_key=api_key,
+        workers=workers,
+        upload_workers=upload_workers,
+        skip_existing=skip_existing,
         delegate=delegate
         )
     return foo.execute_operator(uri, ctx, params=params)
@@ -62,6 +68,31 @@ class NemoRetrieverParse(foo.Operator):
                 label="No NVIDIA_API_KEY found in environment, you can pass it directly here",
                 )
 
+        inputs.int(
+            "workers",
+            default=8,
+            required=True,
+            label="Concurrent requests",
+            description="Maximum number of images to send to the NVIDIA API for parsing at the same time. Concurrency backs off automatically when the API is rate limiting",
+        )
+
+        inputs.int(
+            "upload_workers",
+            default=8,
+            required=True,
+            label="Concurrent uploads",
+            description="Number of images to upload to NVIDIA asset storage at the same time",
+        )
+
+        inputs.bool(
+            "skip_existing",
+            default=True,
+            required=True,
+            label="Skip already processed samples?",
+            description="Only process samples without results from a previous run, including samples that previously failed",
+            view=types.CheckboxView(),
+        )
+
         inputs.bool(
             "delegate",
             default=False,
@@ -99,6 +130,9 @@ class NemoRetrieverParse(foo.Operator):
         """
         view = ctx.target_view()
         api_key = ctx.params.get("api_key")
+        workers = ctx.params.get("workers", 8)
+        upload_workers = ctx.params.get("upload_workers", 8)
+        skip_existing = ctx.params.get("skip_existing", True)
         bbox_field = ctx.params.get("bbox_field")
         output_field = ctx.params.get("output_field")
         confidence_threshold = ctx.params.get("confidence_threshold")
@@ -106,6 +140,9 @@ class NemoRetrieverParse(foo.Operator):
         run_nemo_retriever_parse(
             dataset=view,
             api_key = api_key,
+            workers = workers,
+            upload_workers = upload_workers,
+            skip_existing = skip_existing,
             )
         
 
@@ -115,12 +152,18 @@ class NemoRetrieverParse(foo.Operator):
             self, 
             sample_collection, 
             api_key,
+            workers=8,
+            upload_workers=8,
+            skip_existing=True,
             delegate=False
             ):
         return _handle_calling(
             self.uri,
             sample_collection,
             api_key,
+            workers=workers,
+            upload_workers=upload_workers,
+            skip_existing=skip_existing,
             delegate=delegate
             )
 
@@ -1,31 +1,152 @@
 import os
 import json
+import atexit
+import logging
+import logging.handlers
+import mmap
+import mimetypes
+import queue
+import time
+import base64
+import hashlib
+import threading
 import requests
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 from tqdm import tqdm
-from typing import Dict
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import fiftyone as fo
 from fiftyone.core.labels import Detections, Detection
 
+# Worker threads only enqueue log records; a single background listener thread
+# hands them on to the parent loggers' handlers (root, FiftyOne, delegated
+# operation capture, ...), so logging never blocks a worker on handler I/O.
+# Levels and output are left to the host application
+logger = logging.getLogger(__name__)
 
-def create_headers(api_key: str = None, asset_id: str = None) -> Dict[str, str]:
-    """Create headers for NVIDIA API requests
+class _ParentHandler(logging.Handler):
+    """Passes records on to the handlers of this module's parent loggers"""
+    def emit(self, record: logging.LogRecord):
+        if logger.parent is not None:
+            logger.parent.handle(record)
+
+def _setup_logging():
+    """Route this module's log records through a queue to the parent loggers"""
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers):
+        return
+    
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, _ParentHandler())
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    # Records reach the parent loggers through the listener instead, so they
+    # aren't delivered twice
+    logger.propagate = False
+
+_setup_logging()
+
+# Use orjson for request and response bodies when available
+try:
+    import orjson
+    
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+    
+    _json_loads = json.loads
+
+
+# Per-thread flag recording whether the last request was rate limited, even if
+# the 429 was absorbed by a retry
+_throttle_state = threading.local()
+
+def _record_throttling(response: requests.Response, *args, **kwargs):
+    """Response hook flagging rate-limited requests for the calling thread"""
+    retries = getattr(response.raw, "retries", None)
+    history = retries.history if retries is not None else ()
+    if response.status_code == 429 or any(h.status == 429 for h in history):
+        _throttle_state.throttled = True
+
+def _create_adapter(pool_size: int) -> HTTPAdapter:
+    """Create a pooled HTTP adapter with retries on transient errors
+    
+    Args:
+        pool_size: Maximum number of connections kept alive per host
+        
+    Returns:
+        HTTPAdapter with connection pooling and retries
+    """
+    # Rate limits and transient server errors are retried with exponential
+    # backoff (honoring Retry-After) rather than failing the sample outright.
+    # Read timeouts are not retried: the server may still be running the (paid)
+    # inference, and a timeout should surface right away as ReadTimeout
+    retries = Retry(
+        total=6,
+        read=False,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["POST", "PUT"],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+
+def _create_session(pool_size: int = 32) -> requests.Session:
+    """Create a pooled HTTP session shared by all NVIDIA API requests
+    
+    Keeping connections alive avoids a fresh TCP + TLS handshake for every call.
+    Sessions are safe to share across the worker threads for this use.
+    
+    Args:
+        pool_size: Maximum number of connections kept alive per host
+        
+    Returns:
+        requests.Session with connection pooling and retries on transient errors
+    """
+    session = requests.Session()
+    session.mount("https://", _create_adapter(pool_size))
+    session.hooks["response"].append(_record_throttling)
+    return session
+
+_pool_size = 32
+_pool_lock = threading.Lock()
+_SESSION = _create_session(_pool_size)
+
+def _ensure_pool_size(pool_size: int):
+    """Grow the shared session's connection pool to fit the given concurrency
+    
+    With more concurrent requests to a host than pooled connections, urllib3
+    discards the extra connections after each request and has to reconnect.
+    
+    Args:
+        pool_size: Maximum number of concurrent requests to any single host
+    """
+    global _pool_size
+    
+    with _pool_lock:
+        if pool_size > _pool_size:
+            _SESSION.mount("https://", _create_adapter(pool_size))
+            _pool_size = pool_size
+
+def _resolve_api_key(api_key: str = None) -> str:
+    """Return the API key to use, falling back to the environment
     
     Args:
         api_key: NVIDIA API authentication key. If None or empty, will try to get from environment
-        asset_id: Optional ID of uploaded asset to reference in headers
         
     Returns:
-        Dictionary containing required headers for NVIDIA API requests
+        API key with surrounding whitespace removed
         
     Raises:
         ValueError: If no valid API key is provided and NVIDIA_API_KEY environment variable is not set
-        
-    Note:
-        The API key can be provided in three ways (in order of precedence):
-        1. Directly as an argument to this function
-        2. Through the NVIDIA_API_KEY environment variable
-        3. Through the NVCF_API_KEY environment variable (legacy support)
     """
     # Check for valid api_key parameter
     if not api_key or str(api_key).strip() == "":
@@ -40,27 +161,47 @@ def create_headers(api_key: str = None, asset_id: str = None) -> Dict[str, str]:
                 "Example:\n"
                 "  export NVIDIA_API_KEY='your-api-key'"
             )
+    
+    return str(api_key).strip()
 
-    # Set base authentication headers
+def create_headers(api_key: str = None, asset_id: str = None) -> Dict[str, str]:
+    """Create headers for NVIDIA API requests
+    
+    Args:
+        api_key: NVIDIA API authentication key. If None or empty, will try to get from environment
+        asset_id: Optional ID of uploaded asset to reference in headers
+        
+    Returns:
+        Dictionary containing required headers for NVIDIA API requests
+        
+    Raises:
+        ValueError: If no valid API key is provided and NVIDIA_API_KEY environment variable is not set
+        
+    Note:
+        The API key can be provided in three ways (in order of precedence):
+        1. Directly as an argument to this function
+        2. Through the NVIDIA_API_KEY environment variable
+        3. Through the NVCF_API_KEY environment variable (legacy support)
+    """
+    # Set base authentication headers. All requests using these send JSON bodies
     headers = {
-        "Authorization": f"Bearer {api_key.strip()}",
-        "Accept": "application/json"
+        "Authorization": f"Bearer {_resolve_api_key(api_key)}",
+        "Accept": "application/json",
+        "Content-Type": "application/json"
     }
     
     # Add asset-specific headers if an asset_id is provided
     if asset_id:
-        headers.update({
-            "Content-Type": "application/json",
-            "NVCF-INPUT-ASSET-REFERENCES": asset_id,
-            "NVCF-FUNCTION-ASSET-IDS": asset_id
-        })
+        headers["NVCF-INPUT-ASSET-REFERENCES"] = asset_id
+        headers["NVCF-FUNCTION-ASSET-IDS"] = asset_id
     return headers
 
-def upload_asset(image_data: bytes, description: str, api_key: str = None) -> str:
+def upload_asset(image_path: str, description: str, api_key: str = None) -> str:
     """Upload image asset to NVIDIA's API
     
     Args:
-        image_data: Raw bytes of the image to upload
+        image_path: Path to the image file to upload. The file is streamed from
+            disk rather than read into memory
         description: Text description of the image asset
         api_key: NVIDIA API authentication key. If None, will try to get from environment
         
@@ -68,78 +209,340 @@ def upload_asset(image_data: bytes, description: str, api_key: str = None) -> st
         Asset ID string assigned by NVIDIA API
         
     Raises:
+        IOError: If image file cannot be read
         requests.exceptions.HTTPError: If either API request fails
     """
     # First request to get upload URL and asset ID
-    auth_response = requests.post(
+    auth_response = _SESSION.post(
         "https://api.nvcf.nvidia.com/v2/nvcf/assets",
         headers=create_headers(api_key),
-        json={"contentType": "image/jpeg", "description": description},
+        data=_json_dumps({"contentType": "image/jpeg", "description": description}),
         timeout=30
     )
     auth_response.raise_for_status()
-    auth_data = auth_response.json()
-    
-    # Second request to upload actual image data to provided URL
-    upload_response = requests.put(
-        auth_data["uploadUrl"],
-        data=image_data,
-        headers={
-            "x-amz-meta-nvcf-asset-description": description,
-            "content-type": "image/jpeg"
-        },
-        timeout=300  # Longer timeout for file upload
-    )
+    auth_data = _json_loads(auth_response.content)
+    
+    # Second request to stream image data from disk to provided URL. An explicit
+    # Content-Length avoids chunked transfer encoding, which S3 doesn't accept
+    with open(image_path, "rb") as f:
+        upload_response = _SESSION.put(
+            auth_data["uploadUrl"],
+            data=f,
+            headers={
+                "x-amz-meta-nvcf-asset-description": description,
+                "content-type": "image/jpeg",
+                "content-length": str(os.path.getsize(image_path))
+            },
+            timeout=300  # Longer timeout for file upload
+        )
     upload_response.raise_for_status()
     
     return str(auth_data["assetId"])
 
-def process_image(image_path: str, api_key: str = None) -> Dict:
-    """Send image to NeMo API and get response
+# Uploaded assets are only kept by NVCF for a limited time, so cached asset IDs
+# are treated as stale well before that window closes
+_ASSET_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "nemo_retriever", "assets.json")
+_ASSET_TTL_SECONDS = 50 * 60
+_ASSET_CACHE_FLUSH_EVERY = 50
+
+_asset_cache = None
+_asset_cache_unsaved = 0
+_asset_cache_lock = threading.Lock()
+
+def _load_asset_cache() -> Dict[str, Dict]:
+    """Load unexpired asset cache entries from disk
+    
+    Returns:
+        Dictionary mapping cache keys to {"asset_id", "uploaded_at"} entries
+    """
+    try:
+        with open(_ASSET_CACHE_PATH, "r") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    now = time.time()
+    return {
+        key: entry for key, entry in entries.items()
+        if now - entry.get("uploaded_at", 0) < _ASSET_TTL_SECONDS
+    }
+
+def _save_asset_cache(entries: Dict[str, Dict]):
+    """Atomically write asset cache entries to disk
+    
+    Args:
+        entries: Dictionary mapping cache keys to asset entries
+    """
+    now = time.time()
+    entries = {
+        key: entry for key, entry in entries.items()
+        if now - entry["uploaded_at"] < _ASSET_TTL_SECONDS
+    }
+    
+    try:
+        os.makedirs(os.path.dirname(_ASSET_CACHE_PATH), exist_ok=True)
+        tmp_path = f"{_ASSET_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, _ASSET_CACHE_PATH)
+    except OSError as e:
+        logger.warning("Error saving asset cache: %s", e)
+
+def _flush_asset_cache():
+    """Persist any newly uploaded asset IDs to the on-disk cache"""
+    global _asset_cache_unsaved
+    
+    with _asset_cache_lock:
+        if _asset_cache is not None and _asset_cache_unsaved:
+            _save_asset_cache(_asset_cache)
+            _asset_cache_unsaved = 0
+
+def _hash_file(image_path: str) -> str:
+    """Compute a BLAKE2b digest of a file's contents
+    
+    Args:
+        image_path: Path to file on disk
+        
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open(image_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest.update(mm)
+    return digest.hexdigest()
+
+def _get_or_upload_asset(image_path: str, description: str, api_key: str = None) -> Tuple[str, bool]:
+    """Return an asset ID for the image, uploading it only if not recently uploaded
+    
+    Assets are cached by content hash (and API key, since assets are scoped to
+    an account), both in memory and on disk so reruns can skip uploads entirely.
     
     Args:
         image_path: Path to image file on disk
+        description: Text description of the image asset
         api_key: NVIDIA API authentication key. If None, will try to get from environment
         
     Returns:
-        JSON response from NeMo API containing detection results
+        Tuple of (asset_id, from_cache), where from_cache is True if the asset
+        was uploaded earlier rather than by this call
+    """
+    global _asset_cache, _asset_cache_unsaved
+    
+    key_source = api_key or os.environ.get("NVIDIA_API_KEY") or ""
+    key_digest = hashlib.blake2b(key_source.strip().encode(), digest_size=8).hexdigest()
+    cache_key = f"{key_digest}:{_hash_file(image_path)}"
+    
+    with _asset_cache_lock:
+        if _asset_cache is None:
+            _asset_cache = _load_asset_cache()
+        entry = _asset_cache.get(cache_key)
+        if entry and time.time() - entry["uploaded_at"] < _ASSET_TTL_SECONDS:
+            return entry["asset_id"], True
+    
+    asset_id = upload_asset(image_path, description, api_key)
+    
+    with _asset_cache_lock:
+        _asset_cache[cache_key] = {"asset_id": asset_id, "uploaded_at": time.time()}
+        _asset_cache_unsaved += 1
+        if _asset_cache_unsaved >= _ASSET_CACHE_FLUSH_EVERY:
+            _save_asset_cache(_asset_cache)
+            _asset_cache_unsaved = 0
+    
+    return asset_id, False
+
+def _evict_asset(asset_id: str):
+    """Remove an asset that NVCF no longer accepts from the cache
+    
+    Args:
+        asset_id: Asset ID to evict
+    """
+    global _asset_cache_unsaved
+    
+    with _asset_cache_lock:
+        if not _asset_cache:
+            return
+        stale_keys = [key for key, entry in _asset_cache.items() if entry["asset_id"] == asset_id]
+        for key in stale_keys:
+            del _asset_cache[key]
+        if stale_keys:
+            _asset_cache_unsaved += 1
+
+_MODEL_NAME = "nvidia/nemoretriever-parse"
+
+# Specify markdown_bbox tool for detection. Shared by all requests, never modified
+_MARKDOWN_BBOX_TOOLS = ({
+    "type": "function",
+    "function": {"name": "markdown_bbox"}
+},)
+
+# Images whose base64 encoding is shorter than this are sent inline rather than
+# uploaded as assets, which saves the asset authorization and S3 upload
+# round-trips. The API rejects larger inline images
+_INLINE_THRESHOLD_BYTES = 180_000
+
+def _prepare_image(
+        image_path: str, 
+        api_key: str = None, 
+        inline_threshold_bytes: int = _INLINE_THRESHOLD_BYTES,
+        size_bytes: int = None
+        ) -> Tuple[str, Optional[str], bool]:
+    """Like prepare_image, but also reports whether the asset came from the cache
+    
+    Returns:
+        Tuple of (image_url, asset_id, from_cache)
+    """
+    if size_bytes is None:
+        size_bytes = os.path.getsize(image_path)
+    
+    # Base64 encodes every 3 bytes as 4 characters
+    if 4 * ((size_bytes + 2) // 3) < inline_threshold_bytes:
+        mime_type, _ = mimetypes.guess_type(image_path)
+        if not mime_type or not mime_type.startswith("image/"):
+            mime_type = "image/jpeg"
+        with open(image_path, "rb") as f:
+            image_b64 = base64.b64encode(f.read()).decode()
+        return f"data:{mime_type};base64,{image_b64}", None, False
+    
+    # Upload image file to NVIDIA's asset storage
+    asset_id, from_cache = _get_or_upload_asset(image_path, "Test Image", api_key)
+    return f"data:image/jpeg;asset_id,{asset_id}", asset_id, from_cache
+
+def prepare_image(
+        image_path: str, 
+        api_key: str = None, 
+        inline_threshold_bytes: int = _INLINE_THRESHOLD_BYTES,
+        size_bytes: int = None
+        ) -> Tuple[str, Optional[str]]:
+    """Get an image URL NeMo API can read for an image on disk
+    
+    Args:
+        image_path: Path to image file on disk
+        api_key: NVIDIA API authentication key. If None, will try to get from environment
+        inline_threshold_bytes: Images whose base64 encoding is shorter than this
+            are inlined instead of being uploaded as an asset
+        size_bytes: Size of the image file if already known, e.g. from sample
+            metadata. If None, it is read from disk
+        
+    Returns:
+        Tuple of (image_url, asset_id), where asset_id is None for inlined images
         
     Raises:
         IOError: If image file cannot be read
-        requests.exceptions.HTTPError: If API request fails
+        requests.exceptions.HTTPError: If asset upload fails
     """
-    # Upload image file to NVIDIA's asset storage
-    with open(image_path, "rb") as f:
-        asset_id = upload_asset(f.read(), "Test Image", api_key)
-    
-    # Construct content array with image reference
-    content = [{
-        "type": "image_url",
-        "image_url": {"url": f"data:image/jpeg;asset_id,{asset_id}"}
-    }]
-    
-    # Specify markdown_bbox tool for detection
-    tool = [{
-        "type": "function",
-        "function": {"name": "markdown_bbox"}
-    }]
+    image_url, asset_id, _ = _prepare_image(image_path, api_key, inline_threshold_bytes, size_bytes)
+    return image_url, asset_id
+
+def infer_image(image_url: str, api_key: str = None, asset_id: str = None) -> Dict:
+    """Run NeMo Retriever Parse on an inline or previously uploaded image
     
-    # Build complete API request payload
+    Args:
+        image_url: Image URL returned by prepare_image
+        api_key: NVIDIA API authentication key. If None, will try to get from environment
+        asset_id: Asset ID referenced by image_url, if the image was uploaded
+        
+    Returns:
+        JSON response from NeMo API containing detection results
+        
+    Raises:
+        requests.exceptions.HTTPError: If API request fails
+        requests.exceptions.Timeout: If the API doesn't respond in time
+    """
+    # Build API request payload; only the image reference varies per request
     payload = {
-        "tools": tool,
-        "model": "nvidia/nemoretriever-parse",
-        "messages": [{"role": "user", "content": content}]
+        "tools": _MARKDOWN_BBOX_TOOLS,
+        "model": _MODEL_NAME,
+        "messages": [{
+            "role": "user",
+            "content": [{
+                "type": "image_url",
+                "image_url": {"url": image_url}
+            }]
+        }]
     }
     
     # Make API request to process image
-    response = requests.post(
+    response = _SESSION.post(
         "https://integrate.api.nvidia.com/v1/chat/completions",
         headers=create_headers(api_key, asset_id),
-        json=payload
+        data=_json_dumps(payload),
+        timeout=(10, 300)  # Connect and read timeouts; parsing dense pages can be slow
     )
     response.raise_for_status()
     
-    return response.json()
+    return _json_loads(response.content)
+
+def _infer_prepared_image(
+        image_path: str, 
+        image_url: str, 
+        asset_id: Optional[str], 
+        from_cache: bool, 
+        api_key: str = None
+        ) -> Dict:
+    """Run inference on a prepared image, recovering from dead cached assets
+    
+    If the API rejects an asset with a client error, the asset is evicted from
+    the cache so later runs don't reuse it. If the asset came from the cache, it
+    may have expired on the NVCF side, so the image is uploaded again and
+    inference is retried once.
+    
+    Args:
+        image_path: Path to image file on disk
+        image_url: Image URL returned by _prepare_image
+        asset_id: Asset ID referenced by image_url, if the image was uploaded
+        from_cache: Whether the asset ID came from the cache
+        api_key: NVIDIA API authentication key. If None, will try to get from environment
+        
+    Returns:
+        JSON response from NeMo API containing detection results
+        
+    Raises:
+        requests.exceptions.HTTPError: If API request fails
+    """
+    try:
+        return infer_image(image_url, api_key, asset_id)
+    except requests.exceptions.HTTPError as e:
+        status = e.response.status_code if e.response is not None else None
+        if not asset_id or status is None or not 400 <= status < 500 or status == 429:
+            raise
+        
+        _evict_asset(asset_id)
+        if not from_cache:
+            raise
+    
+    logger.info("Cached asset for %s was rejected, uploading it again", image_path)
+    asset_id, _ = _get_or_upload_asset(image_path, "Test Image", api_key)
+    return infer_image(f"data:image/jpeg;asset_id,{asset_id}", api_key, asset_id)
+
+def process_image(
+        image_path: str, 
+        api_key: str = None, 
+        inline_threshold_bytes: int = _INLINE_THRESHOLD_BYTES
+        ) -> Dict:
+    """Send image to NeMo API and get response
+    
+    Args:
+        image_path: Path to image file on disk
+        api_key: NVIDIA API authentication key. If None, will try to get from environment
+        inline_threshold_bytes: Images whose base64 encoding is shorter than this
+            are inlined instead of being uploaded as an asset
+        
+    Returns:
+        JSON response from NeMo API containing detection results
+        
+    Raises:
+        IOError: If image file cannot be read
+        requests.exceptions.HTTPError: If API request fails
+    """
+    image_url, asset_id, from_cache = _prepare_image(image_path, api_key, inline_threshold_bytes)
+    
+    return _infer_prepared_image(image_path, image_url, asset_id, from_cache, api_key)
+
+# Tool call arguments that contain no detected elements
+_EMPTY_BBOX_ARGUMENTS = ("", "[]", "[[]]")
+_get_bbox_coords = itemgetter("xmin", "ymin", "xmax", "ymax")
 
 def parse_nemo_response_to_detections(response: Dict) -> Detections:
     """Convert NeMo API response to FiftyOne detections format
@@ -152,42 +555,336 @@ def parse_nemo_response_to_detections(response: Dict) -> Detections:
     """
     detections = []
     try:
-        # Extract bounding box data from nested response structure
-        bbox_data = response['choices'][0]['message']['tool_calls'][0]['function']['arguments']
-        elements = json.loads(bbox_data)[0]
+        # Return early for responses without any detected elements
+        choices = response.get('choices') or ()
+        if not choices:
+            return Detections()
+        
+        tool_calls = (choices[0].get('message') or {}).get('tool_calls') or ()
+        if not tool_calls:
+            return Detections()
+        
+        # Extract bounding box data from the first tool call
+        bbox_data = tool_calls[0]['function']['arguments']
+        if bbox_data in _EMPTY_BBOX_ARGUMENTS:
+            return Detections()
+        
+        elements = _json_loads(bbox_data)[0]
         
         # Process each detected element
         for elem in elements:
-            # Convert bounding box coordinates to [x, y, width, height] format
-            bbox = [
-                float(elem['bbox']['xmin']),
-                float(elem['bbox']['ymin']),
-                float(elem['bbox']['xmax']) - float(elem['bbox']['xmin']),  # Convert to width
-                float(elem['bbox']['ymax']) - float(elem['bbox']['ymin'])   # Convert to height
-            ]
+            try:
+                x0, y0, x1, y1 = map(float, _get_bbox_coords(elem['bbox']))
+                label = elem['type']
+                text = elem['text']
+            except (KeyError, TypeError, ValueError) as e:
+                # Skip malformed elements without discarding the rest of the page
+                logger.warning("Skipping malformed element %r: %s", elem, e)
+                continue
             
-            # Create Detection object with element data
-            detection = Detection(
-                label=elem['type'],
-                bounding_box=bbox,
-                text=elem['text']
-            )
-            detections.append(detection)
+            # Create Detection object with bounding box in [x, y, width, height] format
+            detections.append(Detection(
+                label=label,
+                bounding_box=[x0, y0, x1 - x0, y1 - y0],
+                text=text
+            ))
             
-    except Exception as e:
-        print(f"Error parsing response: {e}")
+    except Exception:
+        logger.exception("Error parsing response")
     
     return Detections(detections=detections)
 
-def run_nemo_retriever_parse(dataset: fo.Dataset, api_key: str = None):
+class _AdaptiveLimiter:
+    """Concurrency limit that adapts to API back-pressure (AIMD)
+    
+    The limit grows by one after a run of successful requests and is halved
+    when a request is rate limited or times out. Latency alone isn't used as a
+    signal since parse time varies a lot with page density. Requests that
+    started before the last decrease don't trigger another one, so a single
+    burst of 429s only halves the limit once.
+    
+    Args:
+        initial: Starting number of concurrent requests
+        maximum: Upper bound on concurrent requests
+        increase_after: Consecutive successes required before raising the limit
+    """
+    def __init__(self, initial: int, maximum: int, increase_after: int = 10):
+        self.maximum = max(1, maximum)
+        self.limit = max(1, min(initial, self.maximum))
+        self.increase_after = increase_after
+        self._active = 0
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+    
+    def acquire(self) -> float:
+        """Block until a request slot is available
+        
+        Returns:
+            Start time to pass back to release()
+        """
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+        return time.monotonic()
+    
+    def release(self, started: float, throttled: bool = False):
+        """Free a request slot and adjust the limit
+        
+        Args:
+            started: Start time returned by acquire()
+            throttled: Whether the request was rate limited or timed out
+        """
+        with self._cond:
+            self._active -= 1
+            
+            if throttled:
+                self._successes = 0
+                if started >= self._last_decrease and self.limit > 1:
+                    self.limit = max(1, self.limit // 2)
+                    self._last_decrease = time.monotonic()
+                    logger.info("Reducing concurrent requests to %d", self.limit)
+            else:
+                self._successes += 1
+                if self._successes >= self.increase_after and self.limit < self.maximum:
+                    self.limit += 1
+                    self._successes = 0
+                    logger.info("Increasing concurrent requests to %d", self.limit)
+            
+            self._cond.notify_all()
+
+# Errors that only affect a single image: network and file errors, and API
+# responses that aren't valid JSON or don't have the expected shape. Anything
+# else is a bug and is re-raised
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+_RECOVERABLE_ERRORS = (
+    requests.exceptions.RequestException,
+    OSError,
+    json.JSONDecodeError,
+    KeyError,
+    TypeError,
+    AttributeError,
+)
+
+def _is_timeout(error: Exception) -> bool:
+    """Whether a request error was caused by a connect or read timeout
+    
+    Read timeouts aren't retried by the session, so they surface as
+    requests.exceptions.ReadTimeout. Timeouts wrapped in a ConnectionError
+    (e.g. by a MaxRetryError once retries run out) are also recognized.
+    """
+    if isinstance(error, requests.exceptions.Timeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, urllib3.exceptions.TimeoutError)
+
+def _response_to_result(response: Dict) -> Tuple[Detections, int, int, int]:
+    """Extract detections and token usage statistics from a NeMo API response
+    
+    Args:
+        response: JSON response from NeMo API
+        
+    Returns:
+        Tuple of (detections, prompt_tokens, completion_tokens, total_tokens)
+    """
+    usage = response.get('usage') or {}
+    return (
+        parse_nemo_response_to_detections(response),
+        usage.get('prompt_tokens', 0),
+        usage.get('completion_tokens', 0),
+        usage.get('total_tokens', 0),
+    )
+
+def _iter_results(
+        items: List[Tuple[str, str, Optional[int]]], 
+        api_key: str = None, 
+        upload_workers: int = 8, 
+        inference_workers: int = 8,
+        inline_threshold_bytes: int = _INLINE_THRESHOLD_BYTES
+        ) -> Iterator[Tuple[str, Tuple[Detections, int, int, int]]]:
+    """Run images through a two-stage upload -> inference pipeline
+    
+    Uploader threads push asset IDs onto a bounded queue that inference threads
+    drain, so the next images are uploading while earlier ones are being parsed.
+    The stages have different latencies and are sized independently, and
+    inference concurrency adapts to rate limiting between 1 and inference_workers.
+    
+    Args:
+        items: (sample_id, filepath, size_bytes) tuples to process. size_bytes
+            may be None if the file size isn't known
+        api_key: NVIDIA API authentication key. If None, will try to get from environment
+        upload_workers: Number of threads uploading assets
+        inference_workers: Maximum number of threads calling the inference endpoint
+        inline_threshold_bytes: Images whose base64 encoding is shorter than this
+            are inlined instead of being uploaded as an asset
+        
+    Yields:
+        (sample_id, result) pairs in completion order, where result is a tuple of
+        (detections, prompt_tokens, completion_tokens, total_tokens). If an image
+        can't be read or its requests still fail after retries, empty detections
+        and zero token counts are yielded so that a single failure does not stop
+        the remaining work
+        
+    Raises:
+        Exception: Any unexpected error raised while processing an image
+    """
+    input_q = queue.Queue()
+    upload_q = queue.Queue(maxsize=2 * inference_workers)
+    result_q = queue.Queue()
+    
+    for item in items:
+        input_q.put(item)
+    for _ in range(upload_workers):
+        input_q.put(None)
+    
+    # Inference threads are started at the maximum count, but only as many as
+    # the API is currently keeping up with are allowed to make requests
+    limiter = _AdaptiveLimiter(initial=min(4, inference_workers), maximum=inference_workers)
+    
+    # The last uploader to finish tells the inference threads to stop
+    uploaders_left = [upload_workers]
+    uploaders_lock = threading.Lock()
+    
+    # Set when the consumer stops early so no further uploads or (paid)
+    # inference requests are started
+    stop = threading.Event()
+    
+    def put_unless_stopped(q, item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+    
+    def get_unless_stopped(q):
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        return None
+    
+    def upload_worker():
+        while True:
+            item = get_unless_stopped(input_q)
+            if item is None:
+                break
+            sample_id, filepath, size_bytes = item
+            try:
+                image_url, asset_id, from_cache = _prepare_image(
+                    filepath, api_key, inline_threshold_bytes, size_bytes
+                )
+            except _RECOVERABLE_ERRORS:
+                logger.exception("Error uploading %s", filepath)
+                result_q.put((sample_id, (Detections(), 0, 0, 0)))
+                continue
+            except Exception as e:
+                result_q.put((sample_id, e))
+                continue
+            put_unless_stopped(upload_q, (sample_id, filepath, image_url, asset_id, from_cache))
+        
+        with uploaders_lock:
+            uploaders_left[0] -= 1
+            is_last = uploaders_left[0] == 0
+        if is_last:
+            for _ in range(inference_workers):
+                put_unless_stopped(upload_q, None)
+    
+    def inference_worker():
+        while True:
+            item = get_unless_stopped(upload_q)
+            if item is None:
+                break
+            sample_id, filepath, image_url, asset_id, from_cache = item
+            started = limiter.acquire()
+            if stop.is_set():
+                limiter.release(started)
+                break
+            _throttle_state.throttled = False
+            timed_out = False
+            try:
+                response = _infer_prepared_image(
+                    filepath, image_url, asset_id, from_cache, api_key
+                )
+                result = _response_to_result(response)
+            except _RECOVERABLE_ERRORS as e:
+                logger.exception("Error processing %s", filepath)
+                timed_out = _is_timeout(e)
+                result = (Detections(), 0, 0, 0)
+            except Exception as e:
+                result = e
+            finally:
+                limiter.release(started, _throttle_state.throttled or timed_out)
+            result_q.put((sample_id, result))
+    
+    threads = [threading.Thread(target=upload_worker, daemon=True) for _ in range(upload_workers)]
+    threads += [threading.Thread(target=inference_worker, daemon=True) for _ in range(inference_workers)]
+    for thread in threads:
+        thread.start()
+    
+    try:
+        for _ in range(len(items)):
+            sample_id, result = result_q.get()
+            if isinstance(result, Exception):
+                raise result
+            yield sample_id, result
+    finally:
+        # Stop the workers and discard queued work if the consumer stopped
+        # early. Requests already in flight are left to finish
+        stop.set()
+        for q in (input_q, upload_q):
+            while True:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    break
+    
+    for thread in threads:
+        thread.join()
+
+def _write_results(dataset: fo.Dataset, sample_ids: List[str], results: List[Tuple]):
+    """Write a chunk of per-image results to their samples
+    
+    Args:
+        dataset: FiftyOne dataset being processed
+        sample_ids: IDs of the samples to write, aligned with results
+        results: (detections, prompt_tokens, completion_tokens, total_tokens) tuples
+    """
+    view = dataset.select(sample_ids, ordered=True)
+    view.set_values("nemo_detections", [r[0] for r in results])
+    view.set_values("nemo_prompt_tokens", [r[1] for r in results])
+    view.set_values("nemo_completion_tokens", [r[2] for r in results])
+    view.set_values("nemo_total_tokens", [r[3] for r in results])
+
+def run_nemo_retriever_parse(
+        dataset: fo.Dataset, 
+        api_key: str = None, 
+        workers: int = 8, 
+        upload_workers: int = None,
+        chunk_size: int = 500,
+        inline_threshold_bytes: int = _INLINE_THRESHOLD_BYTES,
+        skip_existing: bool = True
+        ):
     """Process dataset with NeMo Retriever Parse and add detections and token usage fields.
     
     This function processes each image in the dataset through the NeMo API and adds
     the detection results and token usage statistics as new fields to each sample.
+    Images are uploaded and parsed concurrently in separate stages since each one
+    spends most of its time waiting on network round-trips, and results are written
+    back in chunks as they complete, so an interrupted run keeps its completed work.
     
     Args:
         dataset: FiftyOne dataset to process
         api_key: NVIDIA API authentication key. If None, will try to get from environment
+        workers: Maximum number of images to parse concurrently
+        upload_workers: Maximum number of images to upload concurrently. Defaults to workers
+        chunk_size: Number of completed samples to buffer before writing to the dataset
+        inline_threshold_bytes: Images whose base64 encoding is shorter than this are
+            sent inline instead of being uploaded as an asset. Set to 0 to always upload
+        skip_existing: Whether to skip samples that already have token usage from
+            a previous run, so reruns only process new or previously failed samples
         
     The following fields will be added to each sample:
         - nemo_detections: Detected regions with bounding boxes and text
@@ -195,45 +892,64 @@ def run_nemo_retriever_parse(dataset: fo.Dataset, api_key: str = None):
         - nemo_completion_tokens: Number of completion tokens used  
         - nemo_total_tokens: Total tokens used
         
+    Raises:
+        ValueError: If no valid API key is provided and NVIDIA_API_KEY environment variable is not set
+        
     Note:
         If processing fails for any image, empty/zero values will be added to maintain
         alignment with the dataset.
     """
-    # Get all image filepaths from dataset
-    filepaths = dataset.values("filepath")
+    # Fail once up front rather than per sample if no API key is available
+    api_key = _resolve_api_key(api_key)
     
-    # Initialize lists to store results
-    all_detections = []
-    prompt_tokens = []
-    completion_tokens = []
-    total_tokens = []
+    # Get all sample IDs, image filepaths, file sizes (if metadata has been
+    # computed), and previous token usage from dataset in a single query
+    fields = ["id", "filepath", "metadata.size_bytes"]
+    resume = skip_existing and dataset.has_field("nemo_total_tokens")
+    if resume:
+        fields.append("nemo_total_tokens")
+    values = dataset.values(fields)
     
-    # Process each image in the dataset
-    for filepath in tqdm(filepaths, desc="Processing images"):
-        try:
-            # Get API response for current image
-            response = process_image(filepath, api_key)
-            
-            # Extract and store detections
-            detections = parse_nemo_response_to_detections(response)
-            all_detections.append(detections)
-            
-            # Extract and store token usage statistics
-            usage = response.get('usage', {})
-            prompt_tokens.append(usage.get('prompt_tokens', 0))
-            completion_tokens.append(usage.get('completion_tokens', 0))
-            total_tokens.append(usage.get('total_tokens', 0))
-            
-        except Exception as e:
-            print(f"Error processing {filepath}: {e}")
-            # Add empty/zero values to maintain list alignment
-            all_detections.append(Detections())
-            prompt_tokens.append(0)
-            completion_tokens.append(0)
-            total_tokens.append(0)
-    
-    # Add all computed fields to the dataset
-    dataset.set_values("nemo_detections", all_detections)
-    dataset.set_values("nemo_prompt_tokens", prompt_tokens)
-    dataset.set_values("nemo_completion_tokens", completion_tokens)
-    dataset.set_values("nemo_total_tokens", total_tokens)
\ No newline at end of file
+    # Only process samples without results from a previous run. Failed samples
+    # have zero tokens and are retried
+    items = [
+        (sample_id, filepath, size_bytes)
+        for sample_id, filepath, size_bytes, *done_tokens in zip(*values)
+        if not (done_tokens and done_tokens[0])
+    ]
+    
+    # Completed results waiting to be written, keyed by sample ID
+    buffer = {}
+    
+    def flush():
+        if buffer:
+            _write_results(dataset, list(buffer.keys()), list(buffer.values()))
+            buffer.clear()
+    
+    # Each stage talks to its own hosts, so the pool must fit the larger stage
+    upload_workers = max(1, int(upload_workers or workers))
+    workers = max(1, int(workers))
+    _ensure_pool_size(max(upload_workers, workers))
+    
+    # Upload and parse images concurrently, updating progress as each one finishes
+    results = _iter_results(
+        items,
+        api_key=api_key,
+        upload_workers=upload_workers,
+        inference_workers=workers,
+        inline_threshold_bytes=inline_threshold_bytes,
+    )
+    try:
+        for sample_id, result in tqdm(results, total=len(items), desc="Processing images"):
+            buffer[sample_id] = result
+            if len(buffer) >= chunk_size:
+                flush()
+    finally:
+        # Stop the pipeline's workers right away if processing was interrupted
+        results.close()
+        
+        # Write any remaining results, even if processing was interrupted
+        flush()
+        
+        # Persist uploaded asset IDs so reruns can skip uploads
+        _flush_asset_cache()